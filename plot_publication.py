@@ -11,9 +11,20 @@ quality figures for publication
 -------------------------------------------------
 """
 
-import matplotlib.pyplot as plt
+import functools
+from pathlib import Path
+
+import numpy as np
 import matplotlib
 
+# This module only saves figures to files, so the interactive backend
+# (e.g. MacOSX, Qt) is pure overhead: it sets up a GUI canvas for every
+# figure. The non-interactive Agg backend skips that and renders both
+# .png and .svg output, so force it before pyplot is imported. Calling
+# use() unconditionally matters: querying get_backend() first would
+# resolve the backend sentinel, importing pyplot right here.
+matplotlib.use('Agg', force=True)
+
 # * ====================================================================
 # * Set font's properties.
 # ! You must use from `PLOT_academic import *` to enable font size setting
@@ -21,21 +32,74 @@ SMALL_SIZE = 8
 MEDIUM_SIZE = 10
 BIGGER_SIZE = 12
 
-# controls default text sizes
-font = {'family': 'Times New Roman',
-        'weight': 'normal',  # bold
-        'size': SMALL_SIZE}
-matplotlib.rc('font', **font)
-# fontsize of the axes title, namely title of subplot
-plt.rc('axes', titlesize=MEDIUM_SIZE)
-plt.rc('axes', labelsize=MEDIUM_SIZE)    # fontsize of the x and y labels
-plt.rc('xtick', labelsize=SMALL_SIZE)    # fontsize of the tick labels
-plt.rc('ytick', labelsize=SMALL_SIZE)    # fontsize of the tick labels
-plt.rc('legend', fontsize=SMALL_SIZE)    # legend fontsize
-plt.rc('figure', titlesize=BIGGER_SIZE)  # fontsize of the figure title
+# the complete publication style, built once at import so apply_style
+# is a single rcParams.update call
+_STYLE_RCPARAMS = {
+    # controls default text sizes; naming the family 'serif' and
+    # putting Times New Roman first in the serif list primes
+    # matplotlib's own findfont cache in one go. Keep the default
+    # fallbacks behind it, or machines without the font would log a
+    # "Generic family 'serif' not found" warning per drawn text
+    'font.family': 'serif',
+    'font.serif': (['Times New Roman']
+                   + list(matplotlib.rcParamsDefault['font.serif'])),
+    'font.weight': 'normal',  # bold
+    'font.size': SMALL_SIZE,
+    # fontsize of the axes title, namely title of subplot
+    'axes.titlesize': MEDIUM_SIZE,
+    'axes.labelsize': MEDIUM_SIZE,    # fontsize of the x and y labels
+    'xtick.labelsize': SMALL_SIZE,    # fontsize of the tick labels
+    'ytick.labelsize': SMALL_SIZE,    # fontsize of the tick labels
+    'legend.fontsize': SMALL_SIZE,    # legend fontsize
+    'figure.titlesize': BIGGER_SIZE,  # fontsize of the figure title
+    # serif math to match the text font
+    'mathtext.fontset': 'cm',
+    'mathtext.rm': 'serif',
+}
+
+_style_applied = False
+
+
+def apply_style():
+    """Apply the publication font settings to matplotlib's rcParams.
+
+    Called automatically when the first `FigurePublication` is created,
+    so importing this module for `Page` alone does not pay for
+    matplotlib's font setup. Call it explicitly to get the publication
+    style on figures built with plain matplotlib. Repeated calls are
+    no-ops. All keys go through one rcParams.update call, which runs
+    the validators once per key without the per-group bookkeeping of
+    repeated plt.rc() calls.
+    """
+    global _style_applied
+    if _style_applied:
+        return
+    _style_applied = True
+    matplotlib.rcParams.update(_STYLE_RCPARAMS)
 # * =====================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def _ensure_font(family='Times New Roman'):
+    """Resolve the publication font once per process.
+
+    The lru_cache means the font manager is only consulted a single
+    time, however many figures are created. If the font is missing,
+    warn once instead of letting every text draw fall back silently.
+    """
+    import matplotlib.font_manager
+    try:
+        return matplotlib.font_manager.findfont(
+            family, fallback_to_default=False)
+    except ValueError:
+        import warnings
+        warnings.warn('Font %r not found; matplotlib will substitute '
+                      'its default serif font.' % family)
+        # resolve through the generic family, which walks the
+        # font.serif fallback list without logging a missing name
+        return matplotlib.font_manager.findfont('serif')
+
+
 class Page():
     """This class define the size of the page/slide that you want to insert your figure.
     Please set the `height`, `width`, and `margin` of the page/slide in inch.
@@ -44,68 +108,69 @@ class Page():
     section for more information.
     """
 
+    # plain slotted attributes: no name mangling, no property frames on
+    # every access, and no per-instance __dict__; _body caches body_size
+    __slots__ = ('height', 'width', 'margin', '_body')
+
     def __init__(self, height, width, margin=(0, 0, 0, 0)) -> None:
         # Define size of the paper in inch
-        self.__height = height  # inch
-        self.__width = width  # inch
-        self.__margin = margin  # (top, bottum, left, right)
+        self.height = height  # inch
+        self.width = width  # inch
+        self.margin = tuple(margin)  # (top, bottum, left, right)
         self.validate()  # Check if the above parameters are reasonable.
 
     def validate(self):
-        """Check if page parameters are reasonable, i.e., the margin should be 
+        """Check if page parameters are reasonable, i.e., the margin should be
         positive and should not be larger than the page.
+
+        A page is effectively immutable after `__init__`; call this
+        again if you do mutate the attributes.
         """
-        assert self.__height > 0 and self.__width > 0
-        for value in self.margin:
-            assert value >= 0
-        assert self.margin[0] + self.margin[1] < self.__height
-        assert self.margin[2] + self.margin[3] < self.__width
+        # one vectorized check instead of per-value asserts, and raise
+        # ValueError so bad input is still caught under `python -O`
+        m = np.asarray(self.margin, dtype=np.float64)
+        if (self.height <= 0 or self.width <= 0
+                or (m < 0).any()
+                or m[0] + m[1] >= self.height
+                or m[2] + m[3] >= self.width):
+            raise ValueError(
+                'Invalid page setting: size %r with margin %r.'
+                % ((self.height, self.width), tuple(self.margin)))
+        # cache the body size; validate() runs whenever the geometry is
+        # (re)defined, so body_size below is a plain tuple lookup
+        self._body = (self.height-self.margin[0]-self.margin[1],
+                      self.width-self.margin[2]-self.margin[3])
 
     @property
     def page_size(self):
-        return self.__height, self.__width
-
-    @page_size.setter
-    def page_size(self, height, width):
-        self.__height = height
-        self.__width = width
-        self.validate()
+        return self.height, self.width
 
     @property
     def body_size(self):
-        height = self.__height-self.__margin[0]-self.__margin[1]
-        width = self.__width-self.__margin[2]-self.__margin[3]
-        return height, width
-
-    @property
-    def margin(self):
-        return self.__margin
-
-    @margin.setter
-    def margin(self, values):
-        self.__margin = values
-        self.validate()  # Check if the above parameters are reasonable.
+        return self._body
 
     def print_page_setting(self):
         print('The size of the page is %.2f * %.2f.' %
-              (self.__height, self.__width))
+              (self.height, self.width))
         print("""The margin is:
     Top:    %.2f
     Bottom: %.2f
     Left:   %.2f
-    Right:  %.2f""" % self.__margin)
+    Right:  %.2f""" % self.margin)
 
-    # set space between subplot
-    def set_width_space(self, v=0.25):
-        plt.rcParams['figure.subplot.wspace'] = v
+    # set space between subplot of the given figure; writing the global
+    # rcParams instead would invalidate caches of every live figure
+    def set_width_space(self, fig, v=0.25):
+        fig.subplots_adjust(wspace=v)
 
-    def set_height_space(self, v=0.3):
-        plt.rcParams['figure.subplot.hspace'] = v
+    def set_height_space(self, fig, v=0.3):
+        fig.subplots_adjust(hspace=v)
 
 
 class PageA4(Page):
     """Create a subclass of `Page` that has a size of A4 and use default margin setting in Word.
     """
+    __slots__ = ()
 
     def __init__(self, height=11.69, width=8.27, margin=(1, 1, 1.25, 1.25)) -> None:
         super().__init__(height, width, margin)
@@ -118,6 +183,7 @@ class PageA4(Page):
 class PageLetter(Page):
     """Create a subclass of `Page` that has a size of Letter and use default margin setting in Word.
     """
+    __slots__ = ()
 
     def __init__(self, height=11, width=8.5, margin=(1, 1, 1.25, 1.25)) -> None:
         super().__init__(height, width, margin)
@@ -130,6 +196,7 @@ class PageLetter(Page):
 class PageSlide(Page):
     """Create a subclass of `Page` that has a size of slide and use default setting in PowerPoint.
     """
+    __slots__ = ()
 
     def __init__(self, height=0, width=0, aspectRatio='4:3', margin=(0, 0, 0, 0)) -> None:
         if aspectRatio == '4:3':
@@ -145,61 +212,232 @@ class PageSlide(Page):
         super().print_page_setting()
 
 
+# Fraction of the page body that a figure should occupy, indexed by
+# [nrows-1, ncols-1]. Tuned for sub-figures with full x-y labels.
+# Built once at module load instead of on every arrange() call.
+_XY_RATES = np.array(
+    (((0.6, 0.30),  (1.0, 0.28), (1.0, 0.25), (1.0, 0.25)),
+     ((1.0, 0.55),  (1.0, 0.55), (1.0, 0.55), (1.0, 0.55)),
+     ((1.0, 0.80),  (1.0, 0.80), (1.0, 0.80), (1.0, 0.80)),
+     ((1.0, 1.00),  (1.0, 1.00), (1.0, 1.00), (1.0, 1.00))),
+    dtype=np.float64)
+
+
+# file formats that FigurePublication.save understands
+_VALID_FORMATS = frozenset({'svg', 'png', 'pdf'})
+
+
 class FigurePublication():
-    def __init__(self, nrows, ncols, page=PageA4(), xrate=None, yrate=None, tightLayout=True) -> None:
-        self.__bbox_inches = 'tight'
+    def __init__(self, nrows, ncols, page=PageA4(), xrate=None, yrate=None,
+                 tightLayout=True, layout=None,
+                 sharex=False, sharey=False) -> None:
+        """`layout` selects how subplots are fitted into the figure:
+        'tight' runs matplotlib's tight_layout solver (the default),
+        'none' keeps the deterministic geometry from `arrange` and
+        skips the solver entirely — the fast path for batch scripts
+        where the predefined size rates already fit. When `layout` is
+        not given it follows the legacy `tightLayout` flag.
+
+        `sharex`/`sharey` are passed straight to `plt.subplots`
+        (e.g. sharey='row'); sharing axes at construction time batches
+        the tick bookkeeping inside matplotlib, so it is much cheaper
+        than equalizing limits per row or column afterwards.
+        """
+        # arrange() already sizes the figure deterministically from the
+        # page, so recomputing a tight bounding box on save (which draws
+        # the figure a second time) is redundant by default.
+        self.__bbox_inches = None
         # 300 is usually minimum requirement for high resolution images, 600 is better
         self.__dpi = 300
         self.page: Page = page
         self.__nrows = nrows
         self.__ncols = ncols
-        self.fig, self.ax = plt.subplots(nrows, ncols)
+        import matplotlib.pyplot as plt
+        apply_style()
+        _ensure_font()
+        # squeeze=False keeps self.ax a 2-D ndarray whatever the grid
+        # shape, so every loop below can use .flat (a view, no copy)
+        # instead of branching on scalar / 1-D / 2-D results.
+        # Every subplot of a grid gets the same square drawing box so
+        # subplots line up regardless of their tick label widths;
+        # passing it through subplot_kw applies the aspect during Axes
+        # construction, one layout invalidation instead of one per axes.
+        subplot_kw = {'box_aspect': 1} if nrows * ncols > 1 else None
+        self.fig, self.ax = plt.subplots(nrows, ncols, squeeze=False,
+                                         sharex=sharex, sharey=sharey,
+                                         subplot_kw=subplot_kw)
+        if layout is None:
+            layout = 'tight' if tightLayout else 'none'
+        if layout not in ('tight', 'none'):
+            raise ValueError('Unsupported layout: %r' % layout)
+        self.layout = layout
         self.tightLayout = tightLayout
+        # ScaledTranslation instances reused by corner_annotate,
+        # keyed by their (dx, dy) offset
+        self._trans_cache = {}
         self.arrange(xrate, yrate)
 
-    def update(self, tightLayout=True):
-        if tightLayout:  # auto adjust layout
+    def update(self, tightLayout=None):
+        # auto adjust layout; follow the instance setting unless the
+        # caller overrides it
+        if tightLayout is None:
+            tightLayout = self.layout == 'tight'
+        if tightLayout:
             self.fig.tight_layout()
 
-    def arrange(self, xrate=None, yrate=None):
-        """Automatically set size of the figure according to the page size and figure content.
-        You can also do this manually by setting `xrate` and `yrate`.
+    def get_proper_fig_size(self, xrate=None, yrate=None):
+        """Return the figure size `(width, height)` in inch that fits
+        this grid on the current page, from the precomputed rate table.
+        You can override the page fraction with `xrate` and `yrate`.
         """
-        # this rate is for sub-figure with full x-y labels
-        xy = (((0.6, 0.30),  (1.0, 0.28), (1.0, 0.25), (1.0, 0.25)),
-              ((1.0, 0.55),  (1.0, 0.55), (1.0, 0.55), (1.0, 0.55)),
-              ((1.0, 0.80),  (1.0, 0.80), (1.0, 0.80), (1.0, 0.80)),
-              ((1.0, 1.00),  (1.0, 1.00), (1.0, 1.00), (1.0, 1.00)))
-
-        xrate1, yrate1 = xy[self.__nrows-1][self.__ncols-1]
+        if xrate is None or yrate is None:
+            nmax = _XY_RATES.shape[0]
+            if not (1 <= self.__nrows <= nmax and 1 <= self.__ncols <= nmax):
+                raise IndexError(
+                    'No predefined size rate for a %d*%d grid; pass xrate '
+                    'and yrate explicitly.' % (self.__nrows, self.__ncols))
+            xrate1, yrate1 = _XY_RATES[self.__nrows-1, self.__ncols-1]
         # Check these parameters are set manully.
         if xrate is not None:
             xrate1 = xrate
         if yrate is not None:
             yrate1 = yrate
-        # set figure size
         height, width = self.page.body_size
-        width1 = width * xrate1
-        height1 = height * yrate1
+        return width * xrate1, height * yrate1
+
+    def arrange(self, xrate=None, yrate=None):
+        """Automatically set size of the figure according to the page size and figure content.
+        You can also do this manually by setting `xrate` and `yrate`.
+        """
+        # set figure size
+        width1, height1 = self.get_proper_fig_size(xrate, yrate)
         self.fig.set_size_inches(width1, height1)
         # auto adjust layout
         self.update()
 
-    def save(self, savename: str, bbox_inches=None, dpi=None):
-        """Save the figure in .svg format.
+    def save(self, savename: str, bbox_inches=None, dpi=None, tight=False,
+             rasterize_below=None):
+        """Save the figure in .svg, .pdf or .png format.
+
+        By default the figure is saved at the size computed by `arrange`,
+        which avoids the extra full draw that a tight bounding box needs.
+        Pass `tight=True` if you really want the tight bounding box.
+
+        `rasterize_below` embeds all artists whose zorder is below the
+        given value as raster images inside the vector output. This keeps
+        scatter-heavy .svg files small and fast to open while axes, text
+        and lines above the threshold stay vector.
         """
         # format of save name should be "directory/figure.svg"
-        assert savename.split('.')[-1] == 'svg'
-        # if dpi is not assigned external, use dpi store in this class
-        if dpi is None:
-            dpi = self.__dpi
+        format = Path(savename).suffix.lower().lstrip('.')
+        if format not in _VALID_FORMATS:
+            raise ValueError('Unsupported save format %r; expected one '
+                             'of %s.' % (format, sorted(_VALID_FORMATS)))
         # same for bbox_inces
         if bbox_inches is None:
-            bbox_inches = self.__bbox_inches
+            bbox_inches = 'tight' if tight else self.__bbox_inches
+        if rasterize_below is not None and format == 'svg':
+            for ax in self.ax.flat:
+                ax.set_rasterization_zorder(rasterize_below)
         self.update()
-        self.fig.savefig(savename, format='svg',
-                         bbox_inches=bbox_inches,
-                         dpi=dpi)
+        if format == 'svg':
+            # vector output: dpi only affects raster fallbacks, and
+            # dropping the Date metadata keeps repeated runs identical
+            self.fig.savefig(savename, format='svg',
+                             bbox_inches=bbox_inches,
+                             metadata={'Date': None})
+        elif format == 'pdf':
+            self.fig.savefig(savename, format='pdf',
+                             bbox_inches=bbox_inches)
+        else:
+            # if dpi is not assigned external, use dpi store in this class
+            if dpi is None:
+                dpi = self.__dpi
+            # libpng level 1 encodes much faster than the default level
+            # for only slightly larger files
+            self.fig.savefig(savename, format='png',
+                             bbox_inches=bbox_inches,
+                             dpi=dpi,
+                             pil_kwargs={'compress_level': 1,
+                                         'optimize': False})
+
+    def stretch(self, rx=1.0, ry=1.0):
+        """Scale the figure width by `rx` and height by `ry` in one
+        set_size_inches call.
+
+        Stretching both directions through the single-axis wrappers
+        would resize (and re-layout on the next update) twice; this
+        does it once. The layout solver is not rerun here — it runs as
+        usual on the next update()/save().
+        """
+        width, height = self.fig.get_size_inches()
+        self.fig.set_size_inches(width * rx, height * ry)
+
+    # thin single-axis wrappers around stretch()
+    def stretch_figure_width(self, rx):
+        self.stretch(rx=rx)
+
+    def stretch_figure_height(self, ry):
+        self.stretch(ry=ry)
+
+    def corner_annotate(self, ax, text, dx=0.05, dy=-0.05,
+                        horizontal='left', vertical='top'):
+        """Put `text` near the top-left corner of `ax`, offset by
+        `(dx, dy)` in inch, e.g. to number the subplots of a grid.
+
+        Unlike the module-level `corner_annotate` the position does not
+        depend on the data limits. The ScaledTranslation for a given
+        offset is built once per figure and shared by every axes, so
+        annotating a whole grid allocates a single transform.
+        """
+        from matplotlib.transforms import ScaledTranslation
+        key = (dx, dy)
+        transformer = self._trans_cache.get(key)
+        if transformer is None:
+            transformer = self._trans_cache.setdefault(
+                key, ScaledTranslation(dx, dy, self.fig.dpi_scale_trans))
+        ax.text(0.0, 1.0, text, transform=ax.transAxes + transformer,
+                horizontalalignment=horizontal, verticalalignment=vertical)
+
+    def reset(self):
+        """Clear all axes in place so the figure can be reused for the
+        next iteration of a sweep, keeping the canvas and computed size.
+
+        Reusing one FigurePublication with `reset()` between iterations
+        avoids the cost of `plt.subplots` plus arrange() per saved file.
+        """
+        for ax in self.ax.flat:
+            ax.cla()
+        # cla() resets the aspect set in __init__, so restore it
+        if self.__nrows * self.__ncols > 1:
+            for ax in self.ax.flat:
+                ax.set_box_aspect(1)
+
+    def enable_blit(self):
+        """Snapshot the static background of every axes so `redraw` can
+        repaint only the dynamic artists (blitting).
+
+        Call this once after the static content (frames, labels, fixed
+        curves) is in place. Blitting cuts per-frame cost considerably
+        when updating figures in a loop, since axes and ticks are not
+        redrawn every time. Requires the Agg canvas used by this module.
+        """
+        self.fig.canvas.draw()
+        self.__backgrounds = [
+            (ax, self.fig.canvas.copy_from_bbox(ax.bbox))
+            for ax in self.ax.flat]
+
+    def redraw(self, dynamic_artists):
+        """Restore the cached backgrounds and draw only
+        `dynamic_artists` on top of them. `enable_blit` must have been
+        called first.
+        """
+        for ax, background in self.__backgrounds:
+            self.fig.canvas.restore_region(background)
+        for artist in dynamic_artists:
+            artist.axes.draw_artist(artist)
+        for ax, background in self.__backgrounds:
+            self.fig.canvas.blit(ax.bbox)
 
     def change_page(self, newpage=PageSlide()):
         # modify paper size, such as from A4 to a slide in 16:9
@@ -207,22 +445,268 @@ class FigurePublication():
         self.arrange()
 
 
-def get_default_color(type='rgb') -> list:
+class UnitTex():
+    """Build LaTeX-formatted unit strings for axis labels, e.g.
+    `UnitTex.velocity('m', 's')` gives '$\\mathrm{m/s}$'.
+
+    Labels are typically repeated across many subplots, so every
+    builder is memoized and hands back the same cached string.
+    """
+    time_options = ('s', 'min', 'h', 'd')
+    length_options = ('mm', 'cm', 'm', 'km')
+    # frozensets for O(1) membership checks in the builders
+    _TIME_SET = frozenset(time_options)
+    _LENGTH_SET = frozenset(length_options)
+
+    @staticmethod
+    def _check(value, options, kind):
+        if value not in options:
+            raise ValueError('Unsupported %s unit: %r' % (kind, value))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def time(time='s'):
+        UnitTex._check(time, UnitTex._TIME_SET, 'time')
+        return f'$\\mathrm{{{time}}}$'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def length(length='m'):
+        UnitTex._check(length, UnitTex._LENGTH_SET, 'length')
+        return f'$\\mathrm{{{length}}}$'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def area(length='m'):
+        UnitTex._check(length, UnitTex._LENGTH_SET, 'length')
+        return f'$\\mathrm{{{length}^2}}$'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def velocity(length='m', time='s'):
+        UnitTex._check(length, UnitTex._LENGTH_SET, 'length')
+        UnitTex._check(time, UnitTex._TIME_SET, 'time')
+        return f'$\\mathrm{{{length}/{time}}}$'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def discharge(length='m', time='s'):
+        UnitTex._check(length, UnitTex._LENGTH_SET, 'length')
+        UnitTex._check(time, UnitTex._TIME_SET, 'time')
+        return f'$\\mathrm{{{length}^3/{time}}}$'
+
+
+@functools.lru_cache(maxsize=4)
+def get_default_color(type='rgb') -> tuple:
     # [u'#1f77b4', u'#ff7f0e', u'#2ca02c', u'#d62728', u'#9467bd',
     # u'#8c564b', u'#e377c2', u'#7f7f7f', u'#bcbd22', u'#17becf']
-    lst = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']  # hex
+    # Returns tuples rather than lists so that callers cannot mutate
+    # the cached value shared by everyone.
+    from matplotlib.colors import to_hex
+    cycle = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+    # depending on the matplotlib version the cycle holds '#rrggbb'
+    # strings or rgb float tuples; normalize to hex strings once
+    hexes = [to_hex(c) for c in cycle]
     if type == 'rgb':
-        # convert hex to rgb that ranges from 0 to 1
-        lst = [list(int(h.lstrip('#')[i:i+2], 16)/256
-                    for i in (0, 2, 4)) for h in lst]
-    return lst
+        # convert hex to rgb that ranges from 0 to 1: decode all colors
+        # with one bytes.fromhex call and view the result as an Nx3
+        # byte array, instead of parsing per-channel slices in Python
+        raw = ''.join(h[1:] for h in hexes)
+        rgb = np.frombuffer(bytes.fromhex(raw),
+                            dtype=np.uint8).reshape(-1, 3) * (1.0/255.0)
+        return tuple(map(tuple, rgb))
+    return tuple(hexes)
 
 
 def legend(ax):
     ax.legend(frameon=False)  # remove legend background
 
 
+def legend_subplot(fig, lines, labels, label_per_row=8):
+    """Draw one shared legend for the whole figure instead of one per
+    subplot, with at most `label_per_row` entries per row.
+    """
+    if not lines:  # an empty legend would still invalidate the layout
+        return
+    ncol = min(label_per_row, len(lines))
+    fig.legend(lines, labels, loc='upper center', ncol=ncol,
+               frameon=False, handler_map={}, numpoints=1, scatterpoints=1)
+
+
+# position of each corner as a function of the axis limits and the
+# inset rate, so corner_annotate is a single dict lookup per call
+_CORNERS = {
+    ('left', 'top'): lambda xmin, xmax, ymin, ymax, r:
+        (xmin + r*(xmax-xmin), ymax - r*(ymax-ymin)),
+    ('right', 'top'): lambda xmin, xmax, ymin, ymax, r:
+        (xmax - r*(xmax-xmin), ymax - r*(ymax-ymin)),
+    ('left', 'bottom'): lambda xmin, xmax, ymin, ymax, r:
+        (xmin + r*(xmax-xmin), ymin + r*(ymax-ymin)),
+    ('right', 'bottom'): lambda xmin, xmax, ymin, ymax, r:
+        (xmax - r*(xmax-xmin), ymin + r*(ymax-ymin)),
+}
+
+
+def corner_annotate(ax, text, horizontal='left', vertical='top', rate=0.05,
+                    xlim=None, ylim=None):
+    """Put `text` in a corner of the axes, inset by `rate` of the axis
+    span, e.g. to number subplots '(a)', '(b)', ...
+
+    `xlim`/`ylim` can be passed in when the caller already knows the
+    limits, so annotating many axes does not re-query them.
+    """
+    if (horizontal, vertical) not in _CORNERS:
+        raise ValueError('Unsupported corner: %r' % ((horizontal, vertical),))
+    if xlim is None:
+        xlim = ax.get_xlim()
+    if ylim is None:
+        ylim = ax.get_ylim()
+    x, y = _CORNERS[(horizontal, vertical)](*xlim, *ylim, rate)
+    ax.text(x, y, text, horizontalalignment=horizontal,
+            verticalalignment=vertical)
+
+
+# which axis each direction grows and how much of the extra space goes
+# to the lower/upper limit, so more_space is one lookup, no branching
+_DIRECTIONS = {
+    'top':    ('y', 0.0, 1.0),
+    'bottom': ('y', -1.0, 0.0),
+    'right':  ('x', 0.0, 1.0),
+    'left':   ('x', -1.0, 0.0),
+}
+
+
+def more_space(ax, direction='top', rate=0.1, xlim=None, ylim=None):
+    """Grow the axis limit on one side (`'top'`, `'bottom'`, `'left'`
+    or `'right'`) by `rate` of the current span, e.g. to make room for
+    a legend or annotation.
+    """
+    if direction not in _DIRECTIONS:
+        raise ValueError('Unsupported direction: %r' % direction)
+    axis, lower_mul, upper_mul = _DIRECTIONS[direction]
+    if axis == 'y':
+        lim, set_lim = ylim, ax.set_ylim
+        if lim is None:
+            lim = ax.get_ylim()
+    else:
+        lim, set_lim = xlim, ax.set_xlim
+        if lim is None:
+            lim = ax.get_xlim()
+    lower, upper = lim
+    space = rate * (upper - lower)
+    set_lim(lower + lower_mul*space, upper + upper_mul*space)
+
+
+def set_tick_number(ax, n, axis='both'):
+    """Limit `ax` to at most `n` intervals of major ticks on the given
+    axis ('x', 'y' or 'both').
+    """
+    from matplotlib.ticker import MaxNLocator
+    if axis not in ('x', 'y', 'both'):
+        raise ValueError('Unsupported axis: %r' % axis)
+    # one locator per axis: set_major_locator binds the instance to its
+    # axis (Locator.set_axis), so instances must not be shared
+    if axis in ('x', 'both'):
+        ax.xaxis.set_major_locator(MaxNLocator(n))
+    if axis in ('y', 'both'):
+        ax.yaxis.set_major_locator(MaxNLocator(n))
+
+
+def set_tick_number_x(ax, n):
+    set_tick_number(ax, n, axis='x')
+
+
+def set_tick_number_y(ax, n):
+    set_tick_number(ax, n, axis='y')
+
+
+def enable_minor_locator(ax, n=2):
+    """Show `n-1` minor ticks between the major ticks on both axes."""
+    from matplotlib.ticker import AutoMinorLocator
+    # one locator per axis: set_minor_locator binds the instance to its
+    # axis (Locator.set_axis), so instances must not be shared
+    ax.xaxis.set_minor_locator(AutoMinorLocator(n))
+    ax.yaxis.set_minor_locator(AutoMinorLocator(n))
+
+
+def _align_axis(get_ticks, get_lim, set_lim):
+    """Snap one axis' limits outward to the nearest major ticks, so the
+    first and last tick sit exactly on the axis ends. Shared engine of
+    the x/y variants below.
+    """
+    ticks = np.asarray(get_ticks())
+    if ticks.size < 2:
+        return
+    lo, hi = get_lim()
+    # largest tick <= lo and smallest tick >= hi, via one sorted search
+    # each (matplotlib may propose ticks beyond the current limits)
+    idx_lo = np.searchsorted(ticks, lo, side='right') - 1
+    idx_hi = np.searchsorted(ticks, hi, side='left')
+    if idx_lo >= 0:
+        lo = ticks[idx_lo]
+    if idx_hi < ticks.size:
+        hi = ticks[idx_hi]
+    set_lim(lo, hi)
+
+
+def ticks_align_limits_x(ax):
+    """Align the x limits of `ax` with its outermost major ticks."""
+    _align_axis(ax.get_xticks, ax.get_xlim, ax.set_xlim)
+
+
+def ticks_align_limits_y(ax):
+    """Align the y limits of `ax` with its outermost major ticks."""
+    _align_axis(ax.get_yticks, ax.get_ylim, ax.set_ylim)
+
+
+def ticks_align_limits_grid(axes, axis='x'):
+    """Align tick limits for every axes in `axes` (any array or list)
+    in a single pass; `axis` is 'x', 'y' or 'both'.
+    """
+    if axis not in ('x', 'y', 'both'):
+        raise ValueError('Unsupported axis: %r' % axis)
+    for ax in np.ravel(axes):
+        if axis in ('x', 'both'):
+            ticks_align_limits_x(ax)
+        if axis in ('y', 'both'):
+            ticks_align_limits_y(ax)
+
+
+def set_equal_ylim(ax_list, hide_inner_labels=False):
+    """Give every axes in `ax_list` the same y limits, spanning the
+    union of their current limits. Useful to make subplots in one row
+    directly comparable.
+
+    With `hide_inner_labels` the tick labels of every axes but the
+    first are hidden through set_tick_params, which only flips a flag
+    instead of the full axis teardown that set_visible(False) causes.
+    """
+    lims = np.fromiter((v for ax in ax_list for v in ax.get_ylim()),
+                       dtype=np.float64, count=2*len(ax_list)).reshape(-1, 2)
+    ymin, ymax = lims[:, 0].min(), lims[:, 1].max()
+    for ax in ax_list:
+        ax.set_ylim(ymin, ymax)
+    if hide_inner_labels:
+        for ax in ax_list[1:]:
+            ax.yaxis.set_tick_params(labelleft=False)
+
+
+def set_equal_xlim(ax_list, hide_inner_labels=False):
+    """Like `set_equal_ylim`, but for the x limits of subplots in one
+    column; `hide_inner_labels` hides every x tick label except the
+    last (bottom) axes'.
+    """
+    lims = np.fromiter((v for ax in ax_list for v in ax.get_xlim()),
+                       dtype=np.float64, count=2*len(ax_list)).reshape(-1, 2)
+    xmin, xmax = lims[:, 0].min(), lims[:, 1].max()
+    for ax in ax_list:
+        ax.set_xlim(xmin, xmax)
+    if hide_inner_labels:
+        for ax in ax_list[:-1]:
+            ax.xaxis.set_tick_params(labelbottom=False)
+
+
 # * check whether font exist
 if __name__ == "__main__":
-    fontPath = matplotlib.font_manager.findfont('Times New Roman')
+    fontPath = _ensure_font()
     print(fontPath)